@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 # (c) Copyright 2021 Sensirion AG, Switzerland
 
-from __future__ import absolute_import, division, print_function
 from sensirion_shdlc_driver import ShdlcSerialPort, ShdlcConnection
 from sensirion_shdlc_sensorbridge import SensorBridgePort, \
     SensorBridgeShdlcDevice, SensorBridgeI2cProxy
@@ -57,10 +56,10 @@ def bridge(request):
         yield dev
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def scd4x(bridge):
-    # Configure SensorBridge port 1 for SCD4x
-    bridge.set_i2c_frequency(SensorBridgePort.ONE, frequency=100e3)
+    # Configure SensorBridge port 1 for SCD4x, which supports I²C fast mode
+    bridge.set_i2c_frequency(SensorBridgePort.ONE, frequency=400e3)
     bridge.set_supply_voltage(SensorBridgePort.ONE, voltage=3.3)
     bridge.switch_supply_on(SensorBridgePort.ONE)
 
@@ -8,17 +8,20 @@ import os
 import sys
 from datetime import datetime
 
-import pkg_resources
 import sphinx.ext.autodoc
 
 import sensirion_i2c_scd
 
+# Don't write .pyc files for the modules imported by autodoc, they are of no
+# use on (throw-away) CI runners. Subprocesses inherit the setting through the
+# environment.
+sys.dont_write_bytecode = True
+os.environ.setdefault('PYTHONDONTWRITEBYTECODE', '1')
+
 # Add project directory such that sphinx can detect the package.
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # -- Project information -----------------------------------------------------
-distribution = pkg_resources.get_distribution('sensirion_i2c_scd')
-
 project = u'sensirion-i2c-scd'
 copyright = u'{} Sensirion AG, Switzerland'.format(datetime.now().year)
 author = 'Sensirion AG'
@@ -59,8 +62,9 @@ master_doc = 'index'
 #
 html_theme = 'sphinx_rtd_theme'
 
-# Workaround for weirdly formatted function parameters. See https://github.com/readthedocs/sphinx_rtd_theme/issues/766
-html4_writer = True
+# Sphinx 1.8 still uses the HTML4 writer by default, HTML5 is the default
+# only since Sphinx 2.0
+html_experimental_html5_writer = True
 
 html_favicon = 'favicon.ico'
 
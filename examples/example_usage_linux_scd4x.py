@@ -3,7 +3,9 @@
 #
 # (c) Copyright 2023 Sensirion AG, Switzerland
 
-import time
+import asyncio
+import queue
+import threading
 import argparse
 from sensirion_i2c_driver import LinuxI2cTransceiver, I2cConnection
 from sensirion_i2c_scd import Scd4xI2cDevice
@@ -12,22 +14,64 @@ parser = argparse.ArgumentParser()
 parser.add_argument('--i2c-port', '-p', default='/dev/i2c-1')
 args = parser.parse_args()
 
-# Connect to the I²C 1 port
-with LinuxI2cTransceiver(args.i2c_port) as i2c_transceiver:
-    # Create SCD4x device
-    scd4x = Scd4xI2cDevice(I2cConnection(i2c_transceiver))
+# Print the measurements from a background thread, so a slow terminal or
+# redirected output does not delay the next measurement.
+output = queue.Queue(maxsize=256)
 
-    # Make sure measurement is stopped, else we can't read serial number or
-    # start a new measurement
-    scd4x.stop_periodic_measurement()
 
-    print("scd4x Serial Number: {}".format(scd4x.read_serial_number()))
+def print_output():
+    for line in iter(output.get, None):
+        print(line)
 
-    scd4x.start_periodic_measurement()
 
-    # Measure every 5 seconds for 5 minute
-    for _ in range(60):
-        time.sleep(5)
-        co2, temperature, humidity = scd4x.read_measurement()
+printer = threading.Thread(target=print_output, daemon=True)
+printer.start()
+
+
+async def measure(scd4x, duration):
+    """
+    Read measurements for ``duration`` seconds. The sensor provides new data
+    every 5 seconds, it is polled frequently to read out the data as soon as it
+    is available. The blocking I²C transfers run in the default executor, thus
+    other tasks (e.g. reading further sensors) can run concurrently on the
+    event loop.
+    """
+    loop = asyncio.get_running_loop()
+    end = loop.time() + duration
+    while loop.time() < end:
+        measurement = await loop.run_in_executor(
+            None, scd4x.read_measurement_if_ready)
+        if measurement is None:
+            await asyncio.sleep(0.2)
+            continue
+        co2, temperature, humidity = measurement
         # use default formatting for printing output:
-        print("{}, {}, {}".format(co2, temperature, humidity))
+        output.put_nowait(f"{co2}, {temperature}, {humidity}")
+
+
+async def main():
+    # Connect to the I²C 1 port
+    with LinuxI2cTransceiver(args.i2c_port) as i2c_transceiver:
+        # Create SCD4x device
+        scd4x = Scd4xI2cDevice(I2cConnection(i2c_transceiver))
+        # Like in measure(), run all blocking I²C transfers in the executor
+        loop = asyncio.get_running_loop()
+
+        # Make sure measurement is stopped, else we can't read serial number or
+        # start a new measurement
+        await loop.run_in_executor(None, scd4x.stop_periodic_measurement)
+
+        serial_number = await loop.run_in_executor(None, scd4x.read_serial_number)
+        print(f"scd4x Serial Number: {serial_number}")
+
+        await loop.run_in_executor(None, scd4x.start_periodic_measurement)
+
+        # Measure for 5 minutes
+        await measure(scd4x, 300)
+
+
+asyncio.run(main())
+
+# Let the background thread print the remaining measurements
+output.put(None)
+printer.join()
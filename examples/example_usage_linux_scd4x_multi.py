@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# (c) Copyright 2026 Sensirion AG, Switzerland
+
+import time
+import argparse
+from contextlib import ExitStack
+from sensirion_i2c_driver import LinuxI2cTransceiver, I2cConnection
+from sensirion_i2c_scd import Scd4xI2cDevice
+
+# All SCD4x use the same I²C address, thus every sensor needs its own bus,
+# e.g. the channels of an I²C multiplexer exposed by the kernel as
+# /dev/i2c-<N>.
+parser = argparse.ArgumentParser()
+parser.add_argument('--i2c-port', '-p', nargs='+',
+                    default=['/dev/i2c-1', '/dev/i2c-3'])
+args = parser.parse_args()
+
+with ExitStack() as stack:
+    # Create one SCD4x device per I²C port
+    sensors = []
+    for i2c_port in args.i2c_port:
+        i2c_transceiver = stack.enter_context(LinuxI2cTransceiver(i2c_port))
+        sensors.append(Scd4xI2cDevice(I2cConnection(i2c_transceiver)))
+
+    # Make sure measurement is stopped, else we can't read serial number or
+    # start a new measurement
+    for scd4x in sensors:
+        scd4x.stop_periodic_measurement()
+        print(f"scd4x Serial Number: {scd4x.read_serial_number()}")
+
+    # Start all sensors at once, so they all measure in parallel
+    for scd4x in sensors:
+        scd4x.start_periodic_measurement()
+
+    # Measure for 5 minutes. Instead of waiting for every sensor in turn, the
+    # sensors are polled round-robin and only the ones with new data are read
+    # out, thus one tick takes as long as the slowest sensor, not the sum.
+    end = time.monotonic() + 300
+    while time.monotonic() < end:
+        for i2c_port, scd4x in zip(args.i2c_port, sensors):
+            measurement = scd4x.read_measurement_if_ready()
+            if measurement is None:
+                continue  # skip this sensor until its next update
+            co2, temperature, humidity = measurement
+            print(f"{i2c_port}: {co2}, {temperature}, {humidity}")
+        time.sleep(0.2)
+
+    for scd4x in sensors:
+        scd4x.stop_periodic_measurement()
@@ -3,6 +3,8 @@
 #
 # (c) Copyright 2023 Sensirion AG, Switzerland
 
+import queue
+import threading
 import time
 import argparse
 from sensirion_shdlc_driver import ShdlcSerialPort, ShdlcConnection
@@ -11,19 +13,36 @@ from sensirion_shdlc_sensorbridge import SensorBridgePort, \
 from sensirion_i2c_driver import I2cConnection
 from sensirion_i2c_scd import Scd4xI2cDevice
 
+
 parser = argparse.ArgumentParser()
 parser.add_argument('--serial-port', '-p', default='COM1')
+# The SCD4x supports I²C fast mode (400 kHz), use a lower frequency in case of
+# long or noisy wiring
+parser.add_argument('--i2c-freq', type=float, default=400e3)
 args = parser.parse_args()
 
+# Print the measurements from a background thread, so a slow terminal or
+# redirected output does not delay the next measurement.
+output = queue.Queue(maxsize=256)
+
+
+def print_output():
+    for line in iter(output.get, None):
+        print(line)
+
+
+printer = threading.Thread(target=print_output, daemon=True)
+printer.start()
+
 # Connect to the SensorBridge with default settings:
 #  - baudrate:      460800
 #  - slave address: 0
 with ShdlcSerialPort(port=args.serial_port, baudrate=460800) as port:
     bridge = SensorBridgeShdlcDevice(ShdlcConnection(port), slave_address=0)
-    print("SensorBridge SN: {}".format(bridge.get_serial_number()))
+    print(f"SensorBridge SN: {bridge.get_serial_number()}")
 
     # Configure SensorBridge port 1 for SCD4x
-    bridge.set_i2c_frequency(SensorBridgePort.ONE, frequency=100e3)
+    bridge.set_i2c_frequency(SensorBridgePort.ONE, frequency=args.i2c_freq)
     bridge.set_supply_voltage(SensorBridgePort.ONE, voltage=3.3)
     bridge.switch_supply_on(SensorBridgePort.ONE)
 
@@ -35,20 +54,29 @@ with ShdlcSerialPort(port=args.serial_port, baudrate=460800) as port:
     # start a new measurement
     scd4x.stop_periodic_measurement()
 
-    print("scd4x Serial Number: {}".format(scd4x.read_serial_number()))
+    print(f"scd4x Serial Number: {scd4x.read_serial_number()}")
 
     # start periodic measurement in high power mode
     scd4x.start_periodic_measurement()
 
-    # Measure every 5 seconds for 5 minute
-    for _ in range(60):
-        time.sleep(5)
-        co2, temperature, humidity = scd4x.read_measurement()
-        # use default formatting for printing output:
-        print("{}, {}, {}".format(co2, temperature, humidity))
-        # custom printing of attributes:
-        print("{:d} ppm CO2, {:0.2f} °C ({} ticks), {:0.1f} %RH ({} ticks)".format(
-            co2.co2,
-            temperature.degrees_celsius, temperature.ticks,
-            humidity.percent_rh, humidity.ticks))
+    # Measure for 5 minutes. The sensor provides new data every 5 seconds, poll
+    # it frequently to read out the data as soon as it is available.
+    end = time.monotonic() + 300
+    while time.monotonic() < end:
+        measurement = scd4x.read_measurement_if_ready()
+        if measurement is None:
+            time.sleep(0.2)
+            continue
+        co2, temperature, humidity = measurement
+        # use default formatting for the first line and custom printing of
+        # attributes for the second one:
+        output.put_nowait(
+            f"{co2}, {temperature}, {humidity}\n"
+            f"{co2.co2:d} ppm CO2, "
+            f"{temperature.degrees_celsius:0.2f} °C ({temperature.ticks} ticks), "
+            f"{humidity.percent_rh:0.1f} %RH ({humidity.ticks} ticks)")
     scd4x.stop_periodic_measurement()
+
+# Let the background thread print the remaining measurements
+output.put(None)
+printer.join()
@@ -1,6 +1,21 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
-from __future__ import absolute_import, division, print_function
+import sys
+
 from .version import version as __version__  # noqa: F401
 
-from .scd4x.device import Scd4xI2cDevice  # noqa. F401
+__all__ = ['Scd4xI2cDevice', '__version__']
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        """
+        Import the device class lazily (PEP 562), so importing the package
+        (e.g. to get the version) does not load the whole driver stack.
+        """
+        if name == 'Scd4xI2cDevice':
+            from .scd4x.device import Scd4xI2cDevice
+            globals()[name] = Scd4xI2cDevice
+            return Scd4xI2cDevice
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+else:
+    from .scd4x.device import Scd4xI2cDevice  # noqa: F401
@@ -1,3 +1,2 @@
 # -*- coding: utf-8 -*-
 # (c) Copyright 2021 Sensirion AG, Switzerland
-from __future__ import absolute_import, division, print_function
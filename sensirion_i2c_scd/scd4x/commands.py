@@ -3,22 +3,75 @@
 
 # flake8: noqa
 
-from __future__ import absolute_import, division, print_function
-
-from struct import pack, unpack
+from struct import Struct
 
 from sensirion_i2c_driver import SensirionI2cCommand, CrcCalculator
+from sensirion_i2c_driver.errors import I2cChecksumError
 
 from sensirion_i2c_scd.scd4x.response_types import Scd4xHumidity, Scd4xCarbonDioxide, Scd4xTemperature
 from sensirion_i2c_scd.scd4x.data_types import Scd4xTemperatureOffsetDegC
 from sensirion_i2c_scd.scd4x.response_types import Scd4xTemperatureOffset
 
 
+class _Crc8TableCalculator(CrcCalculator):
+    """
+    Table driven variant of :py:class:`~sensirion_i2c_driver.crc_calculator.CrcCalculator`
+    for 8 bit CRCs. The CRC of all 256 byte values is calculated once, thus
+    a single table lookup per byte replaces the bitwise calculation.
+    """
+
+    def __init__(self, polynomial, init_value=0, final_xor=0):
+        """
+        Constructs a calculator object with the given CRC parameters.
+
+        :param int polynomial:
+            The polynomial of the CRC, without leading '1'.
+        :param int init_value:
+            Initialization value of the CRC. Defaults to 0.
+        :param int final_xor:
+            Final XOR value of the CRC. Defaults to 0.
+        """
+        super().__init__(8, polynomial, init_value, final_xor)
+        bitwise = CrcCalculator(8, polynomial)
+        self._table = bytearray(bitwise([value]) for value in range(256))
+
+    def __call__(self, data):
+        """
+        Calculate the CRC of the given data.
+
+        :param iterable data:
+            The input data (iterable with 8-bit integers).
+        :return:
+            The calculated CRC.
+        :rtype:
+            int
+        """
+        table = self._table
+        crc = self._init_value
+        for value in bytearray(data):
+            crc = table[crc ^ value]
+        return crc ^ self._final_xor
+
+
+# The CRC calculator is stateless, thus one instance is shared by all commands
+_SCD4X_CRC = _Crc8TableCalculator(0x31, 0xFF, 0x00)
+
+# Packs a 16 bit word (big endian) of the SCD4x with a precompiled struct
+_pack_uint16 = Struct(">H").pack
+
+# Unpacks the three 16 bit words of a measurement, skipping their CRCs
+_unpack_measurement = Struct(">HxHxHx").unpack
+
+
 class Scd4xI2cCmdBase(SensirionI2cCommand):
     """
     SCD4x I²C base command.
     """
 
+    # The CRC calculator of all SCD4x commands, also available without an
+    # instance (e.g. for interpret_batch())
+    _crc = _SCD4X_CRC
+
     def __init__(self, command, tx_data, rx_length, read_delay, timeout,
                  post_processing_time=0.0):
         """
@@ -57,17 +110,44 @@ class Scd4xI2cCmdBase(SensirionI2cCommand):
             time until it is ready again. Usually this is 0.0s, i.e. no post
             processing is needed.
         """
-        super(Scd4xI2cCmdBase, self).__init__(
+        super().__init__(
             command=command,
             tx_data=tx_data,
             rx_length=rx_length,
             read_delay=read_delay,
             timeout=timeout,
-            crc=CrcCalculator(8, 0x31, 0xFF, 0x00),
+            crc=self._crc,
             command_bytes=2,
             post_processing_time=post_processing_time,
         )
 
+    def _interpret_words(self, data):
+        """
+        Validates the CRCs of the received data from the device and returns
+        the received 16 bit words. In contrast to
+        :py:meth:`~sensirion_i2c_driver.sensirion_command.SensirionI2cCommand.interpret_response`,
+        the words are extracted in the same pass, without building an
+        intermediate buffer without the CRCs.
+
+        :param bytes data:
+            Received raw bytes from the read operation.
+        :return: The received words.
+        :rtype: list
+        :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
+            If a received CRC was wrong.
+        """
+        table = self._crc._table
+        init_value = self._crc._init_value
+        final_xor = self._crc._final_xor
+        words = []
+        for i in range(0, len(data), 3):
+            msb, lsb, received_crc = data[i], data[i + 1], data[i + 2]
+            expected_crc = table[table[init_value ^ msb] ^ lsb] ^ final_xor
+            if received_crc != expected_crc:
+                raise I2cChecksumError(received_crc, expected_crc, data)
+            words.append(msb << 8 | lsb)
+        return words
+
 
 class Scd4xI2cCmdStartPeriodicMeasurement(Scd4xI2cCmdBase):
     """
@@ -82,7 +162,7 @@ class Scd4xI2cCmdStartPeriodicMeasurement(Scd4xI2cCmdBase):
         """
         Constructor.
         """
-        super(Scd4xI2cCmdStartPeriodicMeasurement, self).__init__(
+        super().__init__(
             command=0x21B1,
             tx_data=None,
             rx_length=None,
@@ -108,11 +188,16 @@ class Scd4xI2cCmdReadMeasurement(Scd4xI2cCmdBase):
               updates the measurement values depending on the measurement mode.
     """
 
-    def __init__(self):
+    def __init__(self, verify_crc=True):
         """
         Constructor.
+
+        :param bool verify_crc:
+            Whether the CRCs of the response are checked. Only disable it if
+            a corrupted measurement now and then is acceptable, e.g. for
+            displaying values.
         """
-        super(Scd4xI2cCmdReadMeasurement, self).__init__(
+        super().__init__(
             command=0xEC05,
             tx_data=None,
             rx_length=9,
@@ -120,6 +205,16 @@ class Scd4xI2cCmdReadMeasurement(Scd4xI2cCmdBase):
             timeout=0,
             post_processing_time=0.0,
         )
+        self._verify_crc = verify_crc
+
+    def _interpret_measurement(self, data):
+        """
+        Returns the CO₂, temperature and humidity ticks of the received data,
+        validating the CRCs unless disabled.
+        """
+        if self._verify_crc:
+            return self._interpret_words(data)
+        return _unpack_measurement(data)
 
     def interpret_response(self, data):
         """
@@ -136,17 +231,76 @@ class Scd4xI2cCmdReadMeasurement(Scd4xI2cCmdBase):
             - humidity (:py:class:`~sensirion_i2c_scd.scd4x.response_types.Scd4xHumidity`) -
               Humidity response object
         :rtype: tuple
+        :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
+            If a received CRC was wrong and CRC verification is enabled.
+        """
+        # check CRCs and convert raw received data into proper data types
+        co2, temperature, humidity = self._interpret_measurement(data)  # 3x uint16
+        return Scd4xCarbonDioxide(co2), Scd4xTemperature(temperature), Scd4xHumidity(humidity)
+
+    @classmethod
+    def interpret_batch(cls, data):
+        """
+        Validates the CRCs of many consecutive read measurement responses (e.g.
+        from a log file) at once and returns the raw ticks as NumPy arrays.
+
+        .. note:: This method requires NumPy to be installed.
+
+        :param bytes data:
+            The concatenated raw responses, 9 bytes per measurement.
+        :return:
+            - co2 (numpy.ndarray) - CO₂ ticks (ppm) of all measurements
+            - temperature (numpy.ndarray) - Temperature ticks of all measurements
+            - humidity (numpy.ndarray) - Humidity ticks of all measurements
+        :rtype: tuple
+        :raise ValueError:
+            If the length of the data is not a multiple of 9 bytes.
         :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
             If a received CRC was wrong.
         """
-        # check and remove CRCs
-        checked_data = Scd4xI2cCmdBase.interpret_response(self, data)
+        import numpy as np
 
-        # convert raw received data into proper data types
-        co2 = int(unpack(">H", checked_data[0:2])[0])  # uint16
-        temperature = int(unpack(">H", checked_data[2:4])[0])  # uint16
-        humidity = int(unpack(">H", checked_data[4:6])[0])  # uint16
-        return Scd4xCarbonDioxide(co2), Scd4xTemperature(temperature), Scd4xHumidity(humidity)
+        raw = np.frombuffer(data, dtype=np.uint8)
+        if raw.size % 9 != 0:
+            raise ValueError("Data length must be a multiple of 9 bytes, got {}.".format(raw.size))
+
+        # shape (measurements, words, [MSB, LSB, CRC])
+        words = raw.reshape(-1, 3, 3)
+        msb, lsb, received_crc = words[..., 0], words[..., 1], words[..., 2]
+        table = np.frombuffer(cls._crc._table, dtype=np.uint8)
+        expected_crc = table[table[msb ^ cls._crc._init_value] ^ lsb] ^ cls._crc._final_xor
+        errors = np.flatnonzero(received_crc != expected_crc)
+        if errors.size:
+            index = np.unravel_index(errors[0], received_crc.shape)
+            raise I2cChecksumError(int(received_crc[index]), int(expected_crc[index]), data)
+
+        ticks = (msb.astype(np.uint16) << 8) | lsb
+        return ticks[:, 0], ticks[:, 1], ticks[:, 2]
+
+
+class Scd4xI2cCmdReadMeasurementRaw(Scd4xI2cCmdReadMeasurement):
+    """
+    Read Measurement I²C Command, returning the raw ticks
+
+    Same as :py:class:`Scd4xI2cCmdReadMeasurement`, but no response objects
+    are created. Useful e.g. to log or forward the measurements at a high
+    rate.
+    """
+
+    def interpret_response(self, data):
+        """
+        Validates the CRCs of the received data from the device and returns
+        the raw ticks, without converting them.
+
+        :param bytes data:
+            Received raw bytes from the read operation.
+        :return: The CO₂, temperature and humidity ticks.
+        :rtype: tuple
+        :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
+            If a received CRC was wrong and CRC verification is enabled.
+        """
+        # check CRCs and return the received words as they are
+        return tuple(self._interpret_measurement(data))  # 3x uint16
 
 
 class Scd4xI2cCmdStopPeriodicMeasurement(Scd4xI2cCmdBase):
@@ -163,7 +317,7 @@ class Scd4xI2cCmdStopPeriodicMeasurement(Scd4xI2cCmdBase):
         """
         Constructor.
         """
-        super(Scd4xI2cCmdStopPeriodicMeasurement, self).__init__(
+        super().__init__(
             command=0x3F86,
             tx_data=None,
             rx_length=None,
@@ -188,7 +342,7 @@ class Scd4xI2cCmdGetTemperatureOffset(Scd4xI2cCmdBase):
         """
         Constructor.
         """
-        super(Scd4xI2cCmdGetTemperatureOffset, self).__init__(
+        super().__init__(
             command=0x2318,
             tx_data=None,
             rx_length=3,
@@ -210,11 +364,8 @@ class Scd4xI2cCmdGetTemperatureOffset(Scd4xI2cCmdBase):
         :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
             If a received CRC was wrong.
         """
-        # check and remove CRCs
-        checked_data = Scd4xI2cCmdBase.interpret_response(self, data)
-
-        # convert raw received data into proper data types
-        t_offset = int(unpack(">H", checked_data[0:2])[0])  # uint16
+        # check CRCs and convert raw received data into proper data types
+        t_offset = self._interpret_words(data)[0]  # uint16
         return Scd4xTemperatureOffset(t_offset)
 
 
@@ -240,9 +391,9 @@ class Scd4xI2cCmdSetTemperatureOffset(Scd4xI2cCmdBase):
         :param int t_offset:
             Temperature offset in degree celsius
         """
-        super(Scd4xI2cCmdSetTemperatureOffset, self).__init__(
+        super().__init__(
             command=0x241D,
-            tx_data=b"".join([pack(">H", Scd4xTemperatureOffsetDegC(t_offset).ticks)]),
+            tx_data=_pack_uint16(Scd4xTemperatureOffsetDegC.ticks_from(t_offset)),
             rx_length=None,
             read_delay=0.0,
             timeout=0,
@@ -264,7 +415,7 @@ class Scd4xI2cCmdGetSensorAltitude(Scd4xI2cCmdBase):
         """
         Constructor.
         """
-        super(Scd4xI2cCmdGetSensorAltitude, self).__init__(
+        super().__init__(
             command=0x2322,
             tx_data=None,
             rx_length=3,
@@ -285,11 +436,8 @@ class Scd4xI2cCmdGetSensorAltitude(Scd4xI2cCmdBase):
         :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
             If a received CRC was wrong.
         """
-        # check and remove CRCs
-        checked_data = Scd4xI2cCmdBase.interpret_response(self, data)
-
-        # convert raw received data into proper data types
-        sensor_altitude = int(unpack(">H", checked_data[0:2])[0])  # uint16
+        # check CRCs and convert raw received data into proper data types
+        sensor_altitude = self._interpret_words(data)[0]  # uint16
         return sensor_altitude
 
 
@@ -311,9 +459,9 @@ class Scd4xI2cCmdSetSensorAltitude(Scd4xI2cCmdBase):
         :param int sensor_altitude:
             Sensor altitude in meters.
         """
-        super(Scd4xI2cCmdSetSensorAltitude, self).__init__(
+        super().__init__(
             command=0x2427,
-            tx_data=b"".join([pack(">H", sensor_altitude)]),
+            tx_data=_pack_uint16(sensor_altitude),
             rx_length=None,
             read_delay=0.0,
             timeout=0,
@@ -340,9 +488,9 @@ class Scd4xI2cCmdSetAmbientPressure(Scd4xI2cCmdBase):
         :param int ambient_pressure:
             Ambient pressure in hPa. Convert value to Pa by: value * 100.
         """
-        super(Scd4xI2cCmdSetAmbientPressure, self).__init__(
+        super().__init__(
             command=0xE000,
-            tx_data=b"".join([pack(">H", ambient_pressure)]),
+            tx_data=_pack_uint16(ambient_pressure),
             rx_length=None,
             read_delay=0.0,
             timeout=0,
@@ -372,9 +520,9 @@ class Scd4xI2cCmdPerformForcedRecalibration(Scd4xI2cCmdBase):
         :param int target_co2_concentration:
             Target CO₂ concentration in ppm.
         """
-        super(Scd4xI2cCmdPerformForcedRecalibration, self).__init__(
+        super().__init__(
             command=0x362F,
-            tx_data=b"".join([pack(">H", target_co2_concentration)]),
+            tx_data=_pack_uint16(target_co2_concentration),
             rx_length=3,
             read_delay=0.4,
             timeout=0,
@@ -394,11 +542,8 @@ class Scd4xI2cCmdPerformForcedRecalibration(Scd4xI2cCmdBase):
         :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
             If a received CRC was wrong.
         """
-        # check and remove CRCs
-        checked_data = Scd4xI2cCmdBase.interpret_response(self, data)
-
-        # convert raw received data into proper data types
-        frc_correction = int(unpack(">H", checked_data[0:2])[0])  # uint16
+        # check CRCs and convert raw received data into proper data types
+        frc_correction = self._interpret_words(data)[0]  # uint16
         if frc_correction != 0xFFFF:
             return frc_correction - 0x8000
         return frc_correction
@@ -415,7 +560,7 @@ class Scd4xI2cCmdGetAutomaticSelfCalibration(Scd4xI2cCmdBase):
         """
         Constructor.
         """
-        super(Scd4xI2cCmdGetAutomaticSelfCalibration, self).__init__(
+        super().__init__(
             command=0x2313,
             tx_data=None,
             rx_length=3,
@@ -436,11 +581,8 @@ class Scd4xI2cCmdGetAutomaticSelfCalibration(Scd4xI2cCmdBase):
         :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
             If a received CRC was wrong.
         """
-        # check and remove CRCs
-        checked_data = Scd4xI2cCmdBase.interpret_response(self, data)
-
-        # convert raw received data into proper data types
-        asc_enabled = int(unpack(">H", checked_data[0:2])[0])  # uint16
+        # check CRCs and convert raw received data into proper data types
+        asc_enabled = self._interpret_words(data)[0]  # uint16
         return asc_enabled
 
 
@@ -458,9 +600,9 @@ class Scd4xI2cCmdSetAutomaticSelfCalibration(Scd4xI2cCmdBase):
         :param int asc_enabled:
             1 to enable ASC, 0 to disable ASC
         """
-        super(Scd4xI2cCmdSetAutomaticSelfCalibration, self).__init__(
+        super().__init__(
             command=0x2416,
-            tx_data=b"".join([pack(">H", asc_enabled)]),
+            tx_data=_pack_uint16(asc_enabled),
             rx_length=None,
             read_delay=0.0,
             timeout=0,
@@ -481,7 +623,7 @@ class Scd4xI2cCmdStartLowPowerPeriodicMeasurement(Scd4xI2cCmdBase):
         """
         Constructor.
         """
-        super(Scd4xI2cCmdStartLowPowerPeriodicMeasurement, self).__init__(
+        super().__init__(
             command=0x21AC,
             tx_data=None,
             rx_length=None,
@@ -502,7 +644,7 @@ class Scd4xI2cCmdGetDataReadyStatus(Scd4xI2cCmdBase):
         """
         Constructor.
         """
-        super(Scd4xI2cCmdGetDataReadyStatus, self).__init__(
+        super().__init__(
             command=0xE4B8,
             tx_data=None,
             rx_length=3,
@@ -523,11 +665,8 @@ class Scd4xI2cCmdGetDataReadyStatus(Scd4xI2cCmdBase):
         :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
             If a received CRC was wrong.
         """
-        # check and remove CRCs
-        checked_data = Scd4xI2cCmdBase.interpret_response(self, data)
-
-        # convert raw received data into proper data types
-        data_ready = int(unpack(">H", checked_data[0:2])[0])  # uint16
+        # check CRCs and convert raw received data into proper data types
+        data_ready = self._interpret_words(data)[0]  # uint16
         return data_ready
 
 
@@ -553,7 +692,7 @@ class Scd4xI2cCmdPersistSettings(Scd4xI2cCmdBase):
         """
         Constructor.
         """
-        super(Scd4xI2cCmdPersistSettings, self).__init__(
+        super().__init__(
             command=0x3615,
             tx_data=None,
             rx_length=None,
@@ -577,7 +716,7 @@ class Scd4xI2cCmdGetSerialNumber(Scd4xI2cCmdBase):
         """
         Constructor.
         """
-        super(Scd4xI2cCmdGetSerialNumber, self).__init__(
+        super().__init__(
             command=0x3682,
             tx_data=None,
             rx_length=9,
@@ -599,13 +738,8 @@ class Scd4xI2cCmdGetSerialNumber(Scd4xI2cCmdBase):
         :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
             If a received CRC was wrong.
         """
-        # check and remove CRCs
-        checked_data = Scd4xI2cCmdBase.interpret_response(self, data)
-
-        # convert raw received data into proper data types
-        serial_0 = int(unpack(">H", checked_data[0:2])[0])  # uint16
-        serial_1 = int(unpack(">H", checked_data[2:4])[0])  # uint16
-        serial_2 = int(unpack(">H", checked_data[4:6])[0])  # uint16
+        # check CRCs and convert raw received data into proper data types
+        serial_0, serial_1, serial_2 = self._interpret_words(data)  # 3x uint16
         return serial_0 << 32 | serial_1 << 16 | serial_2
 
 
@@ -621,7 +755,7 @@ class Scd4xI2cCmdPerformSelfTest(Scd4xI2cCmdBase):
         """
         Constructor.
         """
-        super(Scd4xI2cCmdPerformSelfTest, self).__init__(
+        super().__init__(
             command=0x3639,
             tx_data=None,
             rx_length=3,
@@ -642,11 +776,8 @@ class Scd4xI2cCmdPerformSelfTest(Scd4xI2cCmdBase):
         :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
             If a received CRC was wrong.
         """
-        # check and remove CRCs
-        checked_data = Scd4xI2cCmdBase.interpret_response(self, data)
-
-        # convert raw received data into proper data types
-        sensor_status = int(unpack(">H", checked_data[0:2])[0])  # uint16
+        # check CRCs and convert raw received data into proper data types
+        sensor_status = self._interpret_words(data)[0]  # uint16
         return sensor_status
 
 
@@ -669,7 +800,7 @@ class Scd4xI2cCmdPerformFactoryReset(Scd4xI2cCmdBase):
         """
         Constructor.
         """
-        super(Scd4xI2cCmdPerformFactoryReset, self).__init__(
+        super().__init__(
             command=0x3632,
             tx_data=None,
             rx_length=None,
@@ -695,7 +826,7 @@ class Scd4xI2cCmdReinit(Scd4xI2cCmdBase):
         """
         Constructor.
         """
-        super(Scd4xI2cCmdReinit, self).__init__(
+        super().__init__(
             command=0x3646,
             tx_data=None,
             rx_length=None,
@@ -719,7 +850,7 @@ class Scd4xI2cCmdMeasureSingleShot(Scd4xI2cCmdBase):
         """
         Constructor.
         """
-        super(Scd4xI2cCmdMeasureSingleShot, self).__init__(
+        super().__init__(
             command=0x219D,
             tx_data=None,
             rx_length=None,
@@ -742,7 +873,7 @@ class Scd4xI2cCmdMeasureSingleShotRhtOnly(Scd4xI2cCmdBase):
         """
         Constructor.
         """
-        super(Scd4xI2cCmdMeasureSingleShotRhtOnly, self).__init__(
+        super().__init__(
             command=0x2196,
             tx_data=None,
             rx_length=None,
@@ -765,7 +896,7 @@ class Scd4xI2cCmdPowerDown(Scd4xI2cCmdBase):
         """
         Constructor.
         """
-        super(Scd4xI2cCmdPowerDown, self).__init__(
+        super().__init__(
             command=0x36E0,
             tx_data=None,
             rx_length=None,
@@ -788,7 +919,7 @@ class Scd4xI2cCmdWakeUp(Scd4xI2cCmdBase):
         """
         Constructor.
         """
-        super(Scd4xI2cCmdWakeUp, self).__init__(
+        super().__init__(
             command=0x36F6,
             tx_data=None,
             rx_length=None,
@@ -796,3 +927,44 @@ class Scd4xI2cCmdWakeUp(Scd4xI2cCmdBase):
             timeout=0,
             post_processing_time=0.02,
         )
+
+
+# Instances of all commands without arguments. The commands don't keep any state,
+# thus these instances can be executed over and over again instead of creating a
+# new command object for every execution.
+#: Reusable instance of :py:class:`Scd4xI2cCmdStartPeriodicMeasurement`.
+START_PERIODIC_MEASUREMENT = Scd4xI2cCmdStartPeriodicMeasurement()
+#: Reusable instance of :py:class:`Scd4xI2cCmdReadMeasurement`.
+READ_MEASUREMENT = Scd4xI2cCmdReadMeasurement()
+#: Reusable instance of :py:class:`Scd4xI2cCmdReadMeasurementRaw`.
+READ_MEASUREMENT_RAW = Scd4xI2cCmdReadMeasurementRaw()
+#: Reusable instance of :py:class:`Scd4xI2cCmdStopPeriodicMeasurement`.
+STOP_PERIODIC_MEASUREMENT = Scd4xI2cCmdStopPeriodicMeasurement()
+#: Reusable instance of :py:class:`Scd4xI2cCmdGetTemperatureOffset`.
+GET_TEMPERATURE_OFFSET = Scd4xI2cCmdGetTemperatureOffset()
+#: Reusable instance of :py:class:`Scd4xI2cCmdGetSensorAltitude`.
+GET_SENSOR_ALTITUDE = Scd4xI2cCmdGetSensorAltitude()
+#: Reusable instance of :py:class:`Scd4xI2cCmdGetAutomaticSelfCalibration`.
+GET_AUTOMATIC_SELF_CALIBRATION = Scd4xI2cCmdGetAutomaticSelfCalibration()
+#: Reusable instance of :py:class:`Scd4xI2cCmdStartLowPowerPeriodicMeasurement`.
+START_LOW_POWER_PERIODIC_MEASUREMENT = Scd4xI2cCmdStartLowPowerPeriodicMeasurement()
+#: Reusable instance of :py:class:`Scd4xI2cCmdGetDataReadyStatus`.
+GET_DATA_READY_STATUS = Scd4xI2cCmdGetDataReadyStatus()
+#: Reusable instance of :py:class:`Scd4xI2cCmdPersistSettings`.
+PERSIST_SETTINGS = Scd4xI2cCmdPersistSettings()
+#: Reusable instance of :py:class:`Scd4xI2cCmdGetSerialNumber`.
+GET_SERIAL_NUMBER = Scd4xI2cCmdGetSerialNumber()
+#: Reusable instance of :py:class:`Scd4xI2cCmdPerformSelfTest`.
+PERFORM_SELF_TEST = Scd4xI2cCmdPerformSelfTest()
+#: Reusable instance of :py:class:`Scd4xI2cCmdPerformFactoryReset`.
+PERFORM_FACTORY_RESET = Scd4xI2cCmdPerformFactoryReset()
+#: Reusable instance of :py:class:`Scd4xI2cCmdReinit`.
+REINIT = Scd4xI2cCmdReinit()
+#: Reusable instance of :py:class:`Scd4xI2cCmdMeasureSingleShot`.
+MEASURE_SINGLE_SHOT = Scd4xI2cCmdMeasureSingleShot()
+#: Reusable instance of :py:class:`Scd4xI2cCmdMeasureSingleShotRhtOnly`.
+MEASURE_SINGLE_SHOT_RHT_ONLY = Scd4xI2cCmdMeasureSingleShotRhtOnly()
+#: Reusable instance of :py:class:`Scd4xI2cCmdPowerDown`.
+POWER_DOWN = Scd4xI2cCmdPowerDown()
+#: Reusable instance of :py:class:`Scd4xI2cCmdWakeUp`.
+WAKE_UP = Scd4xI2cCmdWakeUp()
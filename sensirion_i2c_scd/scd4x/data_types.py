@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 # (c) Copyright 2021 Sensirion AG, Switzerland
 
-from __future__ import absolute_import, division, print_function
 from enum import IntEnum
 
 
@@ -29,6 +28,8 @@ class Scd4xTemperatureOffsetDegC(object):
     :param int degree_celsius:
         The temperature as degree celsius
     """
+    __slots__ = ('degrees_celsius',)
+
     def __init__(self, degree_celsius):
         """
         Creates an instance from the received raw data.
@@ -37,11 +38,36 @@ class Scd4xTemperatureOffsetDegC(object):
         #: The converted temperature offset in °C.
         self.degrees_celsius = float(degree_celsius)
 
-        #: The converted temperature offset in °F.
-        self.degrees_fahrenheit = 32. + (self.degrees_celsius * 9. / 5.)
+    @property
+    def degrees_fahrenheit(self):
+        """
+        The converted temperature offset in °F.
+
+        :type: float
+        """
+        return 32. + (self.degrees_celsius * 9. / 5.)
+
+    @property
+    def ticks(self):
+        """
+        The ticks (int) as sent to the device.
 
-        #: The ticks (int) as received from the device.
-        self.ticks = int(round(self.degrees_celsius * 65536. / 175.))
+        :type: int
+        """
+        return self.ticks_from(self.degrees_celsius)
+
+    @staticmethod
+    def ticks_from(degree_celsius):
+        """
+        Converts a temperature offset to the ticks as sent to the device,
+        without creating an instance.
+
+        :param float degree_celsius:
+            The temperature offset as degree celsius
+        :return: The ticks.
+        :rtype: int
+        """
+        return int(round(degree_celsius * 65536. / 175.))
 
     def __str__(self):
         return '{:0.1f} °C'.format(self.degrees_celsius)
@@ -1,20 +1,32 @@
 # -*- coding: utf-8 -*-
 # (c) Copyright 2021 Sensirion AG, Switzerland
 
-from __future__ import absolute_import, division, print_function
+import time
 
 from sensirion_i2c_driver import I2cDevice
 from sensirion_i2c_driver.errors import I2cNackError
 
-from .commands import Scd4xI2cCmdGetSerialNumber, Scd4xI2cCmdStartPeriodicMeasurement, \
-    Scd4xI2cCmdStartLowPowerPeriodicMeasurement, Scd4xI2cCmdReadMeasurement, Scd4xI2cCmdStopPeriodicMeasurement, \
-    Scd4xI2cCmdGetTemperatureOffset, Scd4xI2cCmdSetTemperatureOffset, Scd4xI2cCmdGetSensorAltitude, \
+from .commands import Scd4xI2cCmdReadMeasurement, Scd4xI2cCmdReadMeasurementRaw, Scd4xI2cCmdSetTemperatureOffset, \
     Scd4xI2cCmdSetSensorAltitude, Scd4xI2cCmdSetAmbientPressure, Scd4xI2cCmdPerformForcedRecalibration, \
-    Scd4xI2cCmdGetAutomaticSelfCalibration, Scd4xI2cCmdSetAutomaticSelfCalibration, Scd4xI2cCmdGetDataReadyStatus, \
-    Scd4xI2cCmdPersistSettings, Scd4xI2cCmdPerformSelfTest, Scd4xI2cCmdPerformFactoryReset, Scd4xI2cCmdReinit, \
-    Scd4xI2cCmdMeasureSingleShot, Scd4xI2cCmdMeasureSingleShotRhtOnly, Scd4xI2cCmdPowerDown, Scd4xI2cCmdWakeUp
+    Scd4xI2cCmdSetAutomaticSelfCalibration, GET_SERIAL_NUMBER, START_PERIODIC_MEASUREMENT, \
+    START_LOW_POWER_PERIODIC_MEASUREMENT, READ_MEASUREMENT, READ_MEASUREMENT_RAW, STOP_PERIODIC_MEASUREMENT, \
+    GET_TEMPERATURE_OFFSET, GET_SENSOR_ALTITUDE, GET_AUTOMATIC_SELF_CALIBRATION, GET_DATA_READY_STATUS, \
+    PERSIST_SETTINGS, PERFORM_SELF_TEST, PERFORM_FACTORY_RESET, REINIT, MEASURE_SINGLE_SHOT, \
+    MEASURE_SINGLE_SHOT_RHT_ONLY, POWER_DOWN, WAKE_UP
 from .data_types import Scd4xPowerMode
 
+# The least significant 11 bits of the data ready status are 0 if no data is ready
+_DATA_READY_MASK = 0x07FF
+
+# Read measurement commands which skip the CRC verification of the response
+_READ_MEASUREMENT_UNVERIFIED = Scd4xI2cCmdReadMeasurement(verify_crc=False)
+_READ_MEASUREMENT_RAW_UNVERIFIED = Scd4xI2cCmdReadMeasurementRaw(verify_crc=False)
+
+_START_PERIODIC_MEASUREMENT_BY_POWER_MODE = {
+    Scd4xPowerMode.HIGH: START_PERIODIC_MEASUREMENT,
+    Scd4xPowerMode.LOW: START_LOW_POWER_PERIODIC_MEASUREMENT,
+}
+
 
 class Scd4xI2cDevice(I2cDevice):
     """
@@ -30,7 +42,7 @@ class Scd4xI2cDevice(I2cDevice):
         :param byte slave_address:
             The I²C slave address, defaults to 0x62.
         """
-        super(Scd4xI2cDevice, self).__init__(connection, slave_address)
+        super().__init__(connection, slave_address)
 
     def read_serial_number(self):
         """
@@ -39,7 +51,7 @@ class Scd4xI2cDevice(I2cDevice):
         :return: The serial number.
         :rtype: int
         """
-        return self.execute(Scd4xI2cCmdGetSerialNumber())
+        return self.execute(GET_SERIAL_NUMBER)
 
     def start_periodic_measurement(self, power_mode=Scd4xPowerMode.HIGH):
         """
@@ -52,19 +64,22 @@ class Scd4xI2cDevice(I2cDevice):
 
         .. note:: Only available in idle mode.
         """
-        if power_mode == Scd4xPowerMode.HIGH:
-            result = self.execute(Scd4xI2cCmdStartPeriodicMeasurement())
-        elif power_mode == Scd4xPowerMode.LOW:
-            result = self.execute(Scd4xI2cCmdStartLowPowerPeriodicMeasurement())
-        else:
-            raise ValueError('Unknown argument for power_mode')
-        return result
+        try:
+            command = _START_PERIODIC_MEASUREMENT_BY_POWER_MODE[power_mode]
+        except (KeyError, TypeError):  # TypeError if power_mode is not hashable
+            raise ValueError('Unknown argument for power_mode') from None
+        return self.execute(command)
 
-    def read_measurement(self):
+    def read_measurement(self, verify_crc=True):
         """
         Read measurement during periodic measurement mode. Returns Co2, temperature and relative humidity
         as tuple
 
+        :param bool verify_crc:
+            Whether the CRCs of the response are checked, defaults to True.
+            Only disable it if a corrupted measurement now and then is
+            acceptable, e.g. for displaying values.
+
         :return:
             - co2 (:py:class:`~sensirion_i2c_scd.scd4x.response_types.Scd4xCarbonDioxid`) -
               CO₂ response object
@@ -74,7 +89,48 @@ class Scd4xI2cDevice(I2cDevice):
               Humidity response object
         :rtype: tuple
         """
-        return self.execute(Scd4xI2cCmdReadMeasurement())
+        return self.execute(READ_MEASUREMENT if verify_crc else _READ_MEASUREMENT_UNVERIFIED)
+
+    def read_measurement_raw(self, verify_crc=True):
+        """
+        Read measurement during periodic measurement mode. In contrast to
+        :py:meth:`read_measurement`, the raw ticks are returned instead of
+        response objects.
+
+        :param bool verify_crc:
+            Whether the CRCs of the response are checked, defaults to True.
+            Only disable it if a corrupted measurement now and then is
+            acceptable, e.g. for displaying values.
+
+        :return:
+            - co2 (int) - CO₂ concentration in ppm
+            - temperature (int) - Temperature ticks, see
+              :py:class:`~sensirion_i2c_scd.scd4x.response_types.Scd4xTemperature`
+            - humidity (int) - Humidity ticks, see
+              :py:class:`~sensirion_i2c_scd.scd4x.response_types.Scd4xHumidity`
+        :rtype: tuple
+        """
+        return self.execute(READ_MEASUREMENT_RAW if verify_crc else _READ_MEASUREMENT_RAW_UNVERIFIED)
+
+    def read_measurement_if_ready(self, verify_crc=True):
+        """
+        Read measurement during periodic measurement mode, but only if new data
+        is available. In contrast to :py:meth:`read_measurement`, this does not
+        fail if the sensor has no new data yet, thus it can be called in a
+        polling loop.
+
+        :param bool verify_crc:
+            Whether the CRCs of the measurement are checked, see
+            :py:meth:`read_measurement`.
+
+        :return:
+            The same tuple as returned by :py:meth:`read_measurement`, or None
+            if no new measurement data is available yet.
+        :rtype: tuple/None
+        """
+        if not self.get_data_ready_status():
+            return None
+        return self.read_measurement(verify_crc)
 
     def stop_periodic_measurement(self):
         """
@@ -82,7 +138,7 @@ class Scd4xI2cDevice(I2cDevice):
 
         .. note:: this command is only available in periodic measurement mode
         """
-        return self.execute(Scd4xI2cCmdStopPeriodicMeasurement())
+        return self.execute(STOP_PERIODIC_MEASUREMENT)
 
     def get_temperature_offset(self):
         """
@@ -98,7 +154,7 @@ class Scd4xI2cDevice(I2cDevice):
 
         .. note:: Only available in idle mode.
         """
-        return self.execute(Scd4xI2cCmdGetTemperatureOffset())
+        return self.execute(GET_TEMPERATURE_OFFSET)
 
     def set_temperature_offset(self, t_offset):
         """
@@ -126,7 +182,7 @@ class Scd4xI2cDevice(I2cDevice):
 
         .. note:: Only available in idle mode.
         """
-        return self.execute(Scd4xI2cCmdGetSensorAltitude())
+        return self.execute(GET_SENSOR_ALTITUDE)
 
     def set_sensor_altitude(self, sensor_altitude):
         """
@@ -158,6 +214,19 @@ class Scd4xI2cDevice(I2cDevice):
         """
         return self.execute(Scd4xI2cCmdSetAmbientPressure(ambient_pressure))
 
+    def set_ambient_pressure_pa(self, ambient_pressure_pa):
+        """
+        Set the ambient pressure in Pa, as provided by most pressure sensors.
+        The value is rounded half up to hPa (e.g. 98750 Pa to 988 hPa), see
+        :py:meth:`set_ambient_pressure`.
+
+        :param int ambient_pressure_pa:
+            Ambient pressure in Pa.
+
+        .. note:: Available during measurements.
+        """
+        return self.execute(Scd4xI2cCmdSetAmbientPressure(int((ambient_pressure_pa + 50) // 100)))
+
     def perform_forced_recalibration(self, target_co2_concentration):
         """
         Perform Forced Recalibration I²C Command
@@ -186,23 +255,18 @@ class Scd4xI2cDevice(I2cDevice):
         Get Automatic Self Calibration I²C Command
 
         :return: True if ASC is enabled, False if ASC is disabled
-        :rtype: int
+        :rtype: bool
         """
-        ret = self.execute(Scd4xI2cCmdGetAutomaticSelfCalibration())
-        return ret == 1
+        return bool(self.execute(GET_AUTOMATIC_SELF_CALIBRATION))
 
     def set_automatic_self_calibration(self, asc_enabled):
         """
         Set Automatic Self Calibration I²C Command
 
-        :param int asc_enabled:
+        :param bool asc_enabled:
             True to enable ASC, False to disable ASC
         """
-        if asc_enabled:
-            value = 1
-        else:
-            value = 0
-        return self.execute(Scd4xI2cCmdSetAutomaticSelfCalibration(value))
+        return self.execute(Scd4xI2cCmdSetAutomaticSelfCalibration(int(bool(asc_enabled))))
 
     def get_data_ready_status(self):
         """
@@ -213,8 +277,31 @@ class Scd4xI2cDevice(I2cDevice):
         :return: True if data ready, else False
         :rtype: bool
         """
-        ret = self.execute(Scd4xI2cCmdGetDataReadyStatus())
-        return (ret & 0x07FF) > 0
+        return bool(self.execute(GET_DATA_READY_STATUS) & _DATA_READY_MASK)
+
+    def wait_for_data_ready(self, timeout=10.0, poll_interval=0.2):
+        """
+        Block until new measurement data is available for read-out.
+
+        The data ready status is polled with the given interval. To save I²C
+        transactions, sleep until shortly before the next expected update
+        (5 seconds in high power mode, 30 seconds in low power mode) before
+        calling this method.
+
+        :param float timeout:
+            Maximum time to wait in seconds, defaults to 10 seconds. Pass None
+            to wait forever, e.g. in low power mode. Note that no data gets
+            ready at all if no measurement is running.
+        :param float poll_interval:
+            Time to sleep between two data ready status checks in seconds.
+        :raise TimeoutError:
+            If no data got ready within the timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.get_data_ready_status():
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError('No measurement data ready within {} s'.format(timeout))
+            time.sleep(poll_interval)
 
     def persist_settings(self):
         """
@@ -233,7 +320,7 @@ class Scd4xI2cDevice(I2cDevice):
                   calibration history (i.e. FRC and ASC) is automatically stored in
                   a separate EEPROM dimensioned for specified sensor lifetime.
         """
-        return self.execute(Scd4xI2cCmdPersistSettings())
+        return self.execute(PERSIST_SETTINGS)
 
     def perform_self_test(self):
         """
@@ -245,7 +332,7 @@ class Scd4xI2cDevice(I2cDevice):
         :return: 0 means no malfunction detected
         :rtype: int
         """
-        return self.execute(Scd4xI2cCmdPerformSelfTest())
+        return self.execute(PERFORM_SELF_TEST)
 
     def perform_factory_reset(self):
         """
@@ -261,7 +348,7 @@ class Scd4xI2cDevice(I2cDevice):
                   calibration history (i.e. FRC and ASC) is automatically stored in
                   a separate EEPROM dimensioned for specified sensor lifetime.
         """
-        return self.execute(Scd4xI2cCmdPerformFactoryReset())
+        return self.execute(PERFORM_FACTORY_RESET)
 
     def reinit(self):
         """
@@ -274,7 +361,7 @@ class Scd4xI2cDevice(I2cDevice):
 
         .. note:: Only available in idle mode.
         """
-        return self.execute(Scd4xI2cCmdReinit())
+        return self.execute(REINIT)
 
     def measure_single_shot(self):
         """
@@ -285,7 +372,7 @@ class Scd4xI2cDevice(I2cDevice):
 
         .. note:: Only available in idle mode.
         """
-        return self.execute(Scd4xI2cCmdMeasureSingleShot())
+        return self.execute(MEASURE_SINGLE_SHOT)
 
     def measure_single_shot_rht_only(self):
         """
@@ -296,7 +383,7 @@ class Scd4xI2cDevice(I2cDevice):
 
         .. note:: Only available in idle mode.
         """
-        return self.execute(Scd4xI2cCmdMeasureSingleShotRhtOnly())
+        return self.execute(MEASURE_SINGLE_SHOT_RHT_ONLY)
 
     def power_down(self):
         """
@@ -306,7 +393,7 @@ class Scd4xI2cDevice(I2cDevice):
 
         .. note:: Only available in idle mode.
         """
-        return self.execute(Scd4xI2cCmdPowerDown())
+        return self.execute(POWER_DOWN)
 
     def wake_up(self):
         """
@@ -317,7 +404,7 @@ class Scd4xI2cDevice(I2cDevice):
         .. note:: Only available in sleep mode.
         """
         try:
-            self.execute(Scd4xI2cCmdWakeUp())
+            self.execute(WAKE_UP)
         except I2cNackError:
             # This command might result in a I2C NACK if the SCD4x
             # can't wake up fast enough to respond on time
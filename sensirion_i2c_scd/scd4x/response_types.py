@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
 # (c) Copyright 2021 Sensirion AG, Switzerland
 
-from __future__ import absolute_import, division, print_function
-
 
 class Scd4xTemperature(object):
     """
@@ -24,10 +22,38 @@ class Scd4xTemperature(object):
         self.ticks = ticks
 
         #: The converted temperature in °C.
-        self.degrees_celsius = -45. + 175. * ticks / 65535.
+        self.degrees_celsius = self.degrees_celsius_from(ticks)
 
         #: The converted temperature in °F.
-        self.degrees_fahrenheit = -49. + 315. * ticks / 65535.
+        self.degrees_fahrenheit = self.degrees_fahrenheit_from(ticks)
+
+    @staticmethod
+    def degrees_celsius_from(ticks):
+        """
+        Converts ticks to °C without creating an instance. Besides int, also
+        a NumPy array of ticks (e.g. from
+        :py:meth:`~sensirion_i2c_scd.scd4x.commands.Scd4xI2cCmdReadMeasurement.interpret_batch`)
+        can be passed to convert many measurements at once.
+
+        :param int ticks:
+            The ticks as received from the device.
+        :return: The temperature in °C.
+        :rtype: float
+        """
+        return -45. + 175. * ticks / 65535.
+
+    @staticmethod
+    def degrees_fahrenheit_from(ticks):
+        """
+        Converts ticks to °F without creating an instance, see
+        :py:meth:`degrees_celsius_from`.
+
+        :param int ticks:
+            The ticks as received from the device.
+        :return: The temperature in °F.
+        :rtype: float
+        """
+        return -49. + 315. * ticks / 65535.
 
     def __str__(self):
         return '{:0.1f} °C'.format(self.degrees_celsius)
@@ -53,7 +79,22 @@ class Scd4xHumidity(object):
         self.ticks = ticks
 
         #: The converted humidity in %RH.
-        self.percent_rh = 100. * ticks / 65535.
+        self.percent_rh = self.percent_rh_from(ticks)
+
+    @staticmethod
+    def percent_rh_from(ticks):
+        """
+        Converts ticks to %RH without creating an instance. Besides int, also
+        a NumPy array of ticks (e.g. from
+        :py:meth:`~sensirion_i2c_scd.scd4x.commands.Scd4xI2cCmdReadMeasurement.interpret_batch`)
+        can be passed to convert many measurements at once.
+
+        :param int ticks:
+            The ticks as received from the device.
+        :return: The humidity in %RH.
+        :rtype: float
+        """
+        return 100. * ticks / 65535.
 
     def __str__(self):
         return '{:0.1f} %RH'.format(self.percent_rh)
@@ -1,18 +1,16 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
-from __future__ import absolute_import, division, print_function
 
-import os
 import re
+from pathlib import Path
 from setuptools import setup, find_packages
 
 # Python versions this package is compatible with
-python_requires = '>=2.7, !=3.0.*, !=3.1.*, !=3.2.*, !=3.3.*, !=3.4.*, <4'
+python_requires = '>=3.5, <4'
 
 # Packages that this package imports. List everything apart from standard lib packages.
 install_requires = [
     'sensirion-i2c-driver~=1.0.0',
-    'enum34;python_version<"3.4"',
 ]
 
 # Packages required for tests and docs
@@ -21,20 +19,31 @@ extras_require = {
         'flake8~=3.7.8',
         'pytest~=6.2.5',
         'pytest-cov~=3.0.0',
-        'sensirion-shdlc-sensorbridge~=0.1.1'
+        'sensirion-shdlc-sensorbridge~=0.1.1',
+        'numpy~=1.16',
+    ],
+    'numpy': [
+        'numpy~=1.16',
     ],
     'docs': [
         'click==8.0.4',
         'jinja2==3.0.1',
         'sphinx~=1.8.3',
-        'sphinx-rtd-theme~=0.4.2',
+        'sphinx-rtd-theme~=0.5.2',
     ]
 }
 
 
+root_path = Path(__file__).resolve().parent
+
+
+def read_text(name):
+    return (root_path / name).read_text(encoding='utf-8')
+
+
 # Read version number from version.py
-version_line = open("sensirion_i2c_scd/version.py", "rt").read()
-result = re.search(r"^version = ['\"]([^'\"]*)['\"]", version_line, re.M)
+version_regex = re.compile(r"^version = ['\"]([^'\"]*)['\"]", re.M)
+result = version_regex.search(read_text('sensirion_i2c_scd/version.py'))
 if result:
     version_string = result.group(1)
 else:
@@ -42,9 +51,8 @@ else:
 
 
 # Use README.rst and CHANGELOG.rst as package description
-root_path = os.path.dirname(__file__)
-readme = open(os.path.join(root_path, 'README.rst')).read()
-changelog = open(os.path.join(root_path, 'CHANGELOG.rst')).read()
+readme = read_text('README.rst')
+changelog = read_text('CHANGELOG.rst')
 long_description = readme.strip() + "\n\n" + changelog.strip() + "\n"
 
 
@@ -65,7 +73,6 @@ setup(
     classifiers=[
         'Intended Audience :: Developers',
         'License :: Other/Proprietary License',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3.5',
         'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.8',
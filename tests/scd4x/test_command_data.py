@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2026 Sensirion AG, Switzerland
+
+from sensirion_i2c_driver import CrcCalculator
+from sensirion_i2c_driver.errors import I2cChecksumError
+from sensirion_i2c_scd.scd4x.commands import _SCD4X_CRC, _Crc8TableCalculator
+from sensirion_i2c_scd.scd4x.commands import Scd4xI2cCmdSetTemperatureOffset, Scd4xI2cCmdSetSensorAltitude, \
+    Scd4xI2cCmdSetAmbientPressure, Scd4xI2cCmdPerformForcedRecalibration, Scd4xI2cCmdSetAutomaticSelfCalibration, \
+    Scd4xI2cCmdReadMeasurement, Scd4xI2cCmdReadMeasurementRaw, Scd4xI2cCmdGetSerialNumber, Scd4xI2cCmdGetSensorAltitude
+from sensirion_i2c_scd.scd4x.device import Scd4xI2cDevice
+from sensirion_i2c_scd.scd4x.response_types import Scd4xCarbonDioxide, Scd4xTemperature, Scd4xHumidity
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize("data", [
+    b'',
+    b'\xbe\xef',
+    bytearray(range(256)),
+])
+def test_crc(data):
+    """
+    Test if the table driven CRC matches the bitwise calculation.
+    """
+    assert _SCD4X_CRC(data) == CrcCalculator(8, 0x31, 0xFF, 0x00)(data)
+
+
+@pytest.mark.parametrize("value", [
+    dict({'command': Scd4xI2cCmdSetTemperatureOffset(5.4), 'tx_data': b'\x24\x1d\x07\xe6\x48'}),
+    dict({'command': Scd4xI2cCmdSetSensorAltitude(1950), 'tx_data': b'\x24\x27\x07\x9e\x09'}),
+    dict({'command': Scd4xI2cCmdSetAmbientPressure(987), 'tx_data': b'\xe0\x00\x03\xdb\x42'}),
+    dict({'command': Scd4xI2cCmdPerformForcedRecalibration(500), 'tx_data': b'\x36\x2f\x01\xf4\x33'}),
+    dict({'command': Scd4xI2cCmdSetAutomaticSelfCalibration(1), 'tx_data': b'\x24\x16\x00\x01\xb0'}),
+])
+def test_tx_data(value):
+    """
+    Test if the commands send the command ID followed by the argument and its CRC.
+    """
+    assert bytes(value.get('command').tx_data) == value.get('tx_data')
+
+
+class _RecordingConnection(object):
+    """
+    Stub connection which records the executed commands instead of sending them.
+    """
+
+    def __init__(self):
+        self.commands = []
+
+    def execute(self, slave_address, command, wait_post_process=True):
+        self.commands.append(command)
+
+
+@pytest.mark.parametrize("value", [
+    dict({'pressure_pa': 98749, 'pressure_hpa': b'\x03\xdb'}),
+    dict({'pressure_pa': 98750, 'pressure_hpa': b'\x03\xdc'}),
+    dict({'pressure_pa': 98850, 'pressure_hpa': b'\x03\xdd'}),
+])
+def test_set_ambient_pressure_pa(value):
+    """
+    Test if the ambient pressure in Pa is rounded half up to hPa.
+    """
+    connection = _RecordingConnection()
+    Scd4xI2cDevice(connection).set_ambient_pressure_pa(value.get('pressure_pa'))
+    pressure_hpa = value.get('pressure_hpa')
+    assert bytes(connection.commands[0].tx_data) == b'\xe0\x00' + pressure_hpa + bytes([_SCD4X_CRC(pressure_hpa)])
+
+
+def test_read_measurement_response():
+    """
+    Test if the read measurement response is interpreted as expected.
+    """
+    co2, t, rh = Scd4xI2cCmdReadMeasurement().interpret_response(b'\x01\xf4\x33\x66\x67\xa2\x5e\xb9\x3c')
+    assert type(co2) is Scd4xCarbonDioxide
+    assert co2.co2 == 500
+    assert type(t) is Scd4xTemperature
+    assert t.ticks == 0x6667
+    assert type(rh) is Scd4xHumidity
+    assert rh.ticks == 0x5eb9
+
+
+def test_read_measurement_raw_response():
+    """
+    Test if the raw read measurement response consists of the ticks only.
+    """
+    response = b'\x01\xf4\x33\x66\x67\xa2\x5e\xb9\x3c'
+    assert Scd4xI2cCmdReadMeasurementRaw().interpret_response(response) == (500, 0x6667, 0x5eb9)
+
+
+def test_read_measurement_response_unverified():
+    """
+    Test if a wrong CRC is ignored if CRC verification is disabled.
+    """
+    response = b'\x01\xf4\x00\x66\x67\x00\x5e\xb9\x00'
+    assert Scd4xI2cCmdReadMeasurementRaw(verify_crc=False).interpret_response(response) == (500, 0x6667, 0x5eb9)
+    with pytest.raises(I2cChecksumError):
+        Scd4xI2cCmdReadMeasurementRaw().interpret_response(response)
+
+
+def test_serial_number_response():
+    """
+    Test if the serial number words are combined to a 48 bit number.
+    """
+    response = b'\xbe\xef\x92\x01\xf4\x33\x66\x67\xa2'
+    assert Scd4xI2cCmdGetSerialNumber().interpret_response(response) == 0xbeef01f46667
+
+
+def test_response_crc_error():
+    """
+    Test if a wrong CRC in the response raises an exception.
+    """
+    with pytest.raises(I2cChecksumError):
+        Scd4xI2cCmdGetSensorAltitude().interpret_response(b'\x07\x9e\x08')
+
+
+def test_response_crc_of_command():
+    """
+    Test if the responses are validated with the CRC calculator of the command, including its final XOR.
+    """
+    class ReadMeasurementFinalXor(Scd4xI2cCmdReadMeasurementRaw):
+        _crc = _Crc8TableCalculator(0x31, 0xFF, 0x5A)
+
+    crc = CrcCalculator(8, 0x31, 0xFF, 0x5A)
+    words = [b'\x01\xf4', b'\x66\x67', b'\x5e\xb9']
+    response = b''.join(word + bytes([crc(word)]) for word in words)
+    assert ReadMeasurementFinalXor().interpret_response(response) == (500, 0x6667, 0x5eb9)
+    assert [t.tolist() for t in ReadMeasurementFinalXor.interpret_batch(response)] == [[500], [0x6667], [0x5eb9]]
+    with pytest.raises(I2cChecksumError):
+        Scd4xI2cCmdReadMeasurementRaw().interpret_response(response)
+
+
+def test_read_measurement_batch():
+    """
+    Test if many read measurement responses are interpreted at once.
+    """
+    responses = b'\x01\xf4\x33\x66\x67\xa2\x5e\xb9\x3c' + b'\xbe\xef\x92\x07\x9e\x09\x07\xe6\x48'
+    co2, t, rh = Scd4xI2cCmdReadMeasurement.interpret_batch(responses)
+    assert co2.tolist() == [500, 0xbeef]
+    assert t.tolist() == [0x6667, 0x079e]
+    assert rh.tolist() == [0x5eb9, 0x07e6]
+    assert co2.dtype == np.uint16
+
+
+@pytest.mark.parametrize("value", [
+    dict({'data': b'\x01\xf4\x33\x66\x67\xa2\x5e\xb9\x3c' + b'\xbe\xef\x92\x07\x9e\x08\x07\xe6\x48',
+          'error': I2cChecksumError}),
+    dict({'data': b'\x01\xf4\x33\x66\x67\xa2\x5e\xb9', 'error': ValueError}),
+])
+def test_read_measurement_batch_error(value):
+    """
+    Test if a wrong CRC or an incomplete response is detected in a batch.
+    """
+    with pytest.raises(value.get('error')):
+        Scd4xI2cCmdReadMeasurement.interpret_batch(value.get('data'))
@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
 # (c) Copyright 2020 Sensirion AG, Switzerland
 
-from __future__ import absolute_import, division, print_function
-
 import pytest
 import time
 
@@ -13,22 +11,43 @@ from sensirion_i2c_scd.scd4x.response_types import Scd4xTemperature, Scd4xHumidi
     Scd4xTemperatureOffset
 
 
+@pytest.fixture
+def periodic_scd4x(scd4x):
+    """
+    The SCD4x shared by all tests of this module, which is brought back to
+    idle mode after a periodic measurement test, even if the test failed.
+    """
+    yield scd4x
+    scd4x.stop_periodic_measurement()
+
+
+@pytest.fixture(scope="module")
+def original_altitude(scd4x):
+    """
+    Restore the sensor altitude once all tests of this module are done.
+    """
+    altitude = scd4x.get_sensor_altitude()
+    yield altitude
+    scd4x.set_sensor_altitude(altitude)
+
+
 @pytest.mark.needs_device
 @pytest.mark.needs_scd4x
 @pytest.mark.parametrize("power_mode", [
     Scd4xPowerMode.HIGH,
     Scd4xPowerMode.LOW,
 ])
-def test_periodic_measurement(scd4x, power_mode):
+def test_periodic_measurement(periodic_scd4x, power_mode):
     """
     Test periodic measurement in high and low power mode
     """
+    scd4x = periodic_scd4x
+    update_interval = 5.0 if power_mode == Scd4xPowerMode.HIGH else 30.0
     scd4x.start_periodic_measurement(power_mode)
-    while not scd4x.get_data_ready_status():
-        # wait until data is ready to be read out
-        time.sleep(1)
+    # no data is available before the first signal update interval elapsed
+    time.sleep(update_interval - 0.2)
+    scd4x.wait_for_data_ready(timeout=update_interval)
     co2, t, rh = scd4x.read_measurement()
-    scd4x.stop_periodic_measurement()
 
     assert type(co2) is Scd4xCarbonDioxide
     assert type(co2.ticks) is int
@@ -38,6 +57,40 @@ def test_periodic_measurement(scd4x, power_mode):
     assert type(rh.ticks) is int
 
 
+@pytest.mark.needs_device
+@pytest.mark.needs_scd4x
+def test_read_measurement_if_ready(periodic_scd4x):
+    """
+    Test reading measurement only if new data is available
+    """
+    scd4x = periodic_scd4x
+    scd4x.start_periodic_measurement()
+    # no data is available before the first signal update interval elapsed
+    time.sleep(4.8)
+    measurement = scd4x.read_measurement_if_ready()
+    while measurement is None:
+        # wait until data is ready to be read out
+        time.sleep(0.2)
+        measurement = scd4x.read_measurement_if_ready()
+    # the data buffer is emptied upon read-out
+    assert scd4x.read_measurement_if_ready() is None
+
+    co2, t, rh = measurement
+    assert type(co2) is Scd4xCarbonDioxide
+    assert type(t) is Scd4xTemperature
+    assert type(rh) is Scd4xHumidity
+
+
+@pytest.mark.needs_device
+@pytest.mark.needs_scd4x
+def test_wait_for_data_ready_timeout(scd4x):
+    """
+    Test waiting for data times out if no measurement is running
+    """
+    with pytest.raises(TimeoutError):
+        scd4x.wait_for_data_ready(timeout=0.5)
+
+
 @pytest.mark.needs_device
 @pytest.mark.needs_scd4x
 def test_get_temperature_offset(scd4x):
@@ -84,15 +137,13 @@ def test_get_sensor_altitude(scd4x):
     500,
     700,
 ])
-def test_set_sensor_altitude(scd4x, expected_altitude):
+def test_set_sensor_altitude(scd4x, original_altitude, expected_altitude):
     """
     Test set sensor altitude in meters above sea level
     """
-    original_altitude = scd4x.get_sensor_altitude()
     scd4x.set_sensor_altitude(expected_altitude)
     altitude = scd4x.get_sensor_altitude()
     assert altitude == expected_altitude
-    scd4x.set_sensor_altitude(original_altitude)
 
 
 @pytest.mark.needs_device
@@ -133,6 +184,17 @@ def test_measure_single_shot(scd4x):
     assert type(rh) is Scd4xHumidity
 
 
+@pytest.mark.needs_device
+@pytest.mark.needs_scd4x
+def test_read_measurement_raw(scd4x):
+    """
+    Test read measurement as raw ticks after a single shot measurement
+    """
+    scd4x.measure_single_shot()
+    co2, t, rh = scd4x.read_measurement_raw()
+    assert (type(co2), type(t), type(rh)) == (int, int, int)
+
+
 @pytest.mark.needs_device
 @pytest.mark.needs_scd4x
 def test_measure_single_shot_rht_only(scd4x):
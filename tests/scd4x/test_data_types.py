@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 # (c) Copyright 2021 Sensirion AG, Switzerland
 
-from __future__ import absolute_import, division, print_function
 from sensirion_i2c_scd.scd4x.data_types import Scd4xTemperatureOffsetDegC
 import pytest
 
@@ -16,10 +15,22 @@ def test_temperature_offset_degc(value):
     Test if the TemperatureOffset() type works as expected for different values.
     """
     result = Scd4xTemperatureOffsetDegC(value.get('degrees_celsius'))
-    assert type(result) is Scd4xTemperatureOffsetDegC
-    assert type(result.ticks) is int
+    assert (type(result), type(result.ticks), type(result.degrees_celsius), type(result.degrees_fahrenheit)) == \
+        (Scd4xTemperatureOffsetDegC, int, float, float)
     assert result.ticks == value.get('ticks')
-    assert type(result.degrees_celsius) is float
     assert result.degrees_celsius == value.get('degrees_celsius')
-    assert type(result.degrees_fahrenheit) is float
     assert result.degrees_fahrenheit == value.get('degrees_fahrenheit')
+
+
+@pytest.mark.parametrize("value", [
+    dict({'ticks': 0, 'degrees_celsius': 0}),
+    dict({'ticks': 1498, 'degrees_celsius': 4.0}),
+    dict({'ticks': 65536, 'degrees_celsius': 175.}),
+])
+def test_temperature_offset_degc_ticks_from(value):
+    """
+    Test if the ticks can be calculated without creating an instance.
+    """
+    ticks = Scd4xTemperatureOffsetDegC.ticks_from(value.get('degrees_celsius'))
+    assert type(ticks) is int
+    assert ticks == value.get('ticks')
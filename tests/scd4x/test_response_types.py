@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
 # (c) Copyright 2021 Sensirion AG, Switzerland
 
-from __future__ import absolute_import, division, print_function
 from sensirion_i2c_scd.scd4x.response_types import Scd4xCarbonDioxide, Scd4xTemperature, Scd4xHumidity, \
     Scd4xTemperatureOffset
+import numpy as np
 import pytest
 
 
@@ -16,10 +16,9 @@ def test_co2(value):
     Test if the CO2() type works as expected for different values.
     """
     result = Scd4xCarbonDioxide(value.get('ticks'))
-    assert type(result) is Scd4xCarbonDioxide
-    assert type(result.ticks) is int
+    assert (type(result), type(result.ticks), type(result.co2)) == \
+        (Scd4xCarbonDioxide, int, int)
     assert result.ticks == value.get('ticks')
-    assert type(result.co2) is int
     assert result.co2 == value.get('co2')
 
 
@@ -33,13 +32,13 @@ def test_temperature(value):
     Test if the Temperature() type works as expected for different values.
     """
     result = Scd4xTemperature(value.get('ticks'))
-    assert type(result) is Scd4xTemperature
-    assert type(result.ticks) is int
+    assert (type(result), type(result.ticks), type(result.degrees_celsius), type(result.degrees_fahrenheit)) == \
+        (Scd4xTemperature, int, float, float)
     assert result.ticks == value.get('ticks')
-    assert type(result.degrees_celsius) is float
     assert result.degrees_celsius == value.get('degrees_celsius')
-    assert type(result.degrees_fahrenheit) is float
     assert result.degrees_fahrenheit == value.get('degrees_fahrenheit')
+    assert Scd4xTemperature.degrees_celsius_from(value.get('ticks')) == value.get('degrees_celsius')
+    assert Scd4xTemperature.degrees_fahrenheit_from(value.get('ticks')) == value.get('degrees_fahrenheit')
 
 
 @pytest.mark.parametrize("value", [
@@ -51,11 +50,21 @@ def test_humidity(value):
     Test if the Humidity() type works as expected for different values.
     """
     result = Scd4xHumidity(value.get('ticks'))
-    assert type(result) is Scd4xHumidity
-    assert type(result.ticks) is int
+    assert (type(result), type(result.ticks), type(result.percent_rh)) == \
+        (Scd4xHumidity, int, float)
     assert result.ticks == value.get('ticks')
-    assert type(result.percent_rh) is float
     assert result.percent_rh == value.get('percent_rh')
+    assert Scd4xHumidity.percent_rh_from(value.get('ticks')) == value.get('percent_rh')
+
+
+def test_convert_ticks_array():
+    """
+    Test if the conversions of ticks also work with NumPy arrays.
+    """
+    ticks = np.array([0, 65535], dtype=np.uint16)
+    assert Scd4xTemperature.degrees_celsius_from(ticks).tolist() == [-45., 130.]
+    assert Scd4xTemperature.degrees_fahrenheit_from(ticks).tolist() == [-49., 266.]
+    assert Scd4xHumidity.percent_rh_from(ticks).tolist() == [0., 100.]
 
 
 @pytest.mark.parametrize("value", [
@@ -68,10 +77,8 @@ def test_temperature_offset(value):
     Test if the TemperatureOffset() type works as expected for different values.
     """
     result = Scd4xTemperatureOffset(value.get('ticks'))
-    assert type(result) is Scd4xTemperatureOffset
-    assert type(result.ticks) is int
+    assert (type(result), type(result.ticks), type(result.degrees_celsius), type(result.degrees_fahrenheit)) == \
+        (Scd4xTemperatureOffset, int, float, float)
     assert result.ticks == value.get('ticks')
-    assert type(result.degrees_celsius) is float
     assert result.degrees_celsius == value.get('degrees_celsius')
-    assert type(result.degrees_fahrenheit) is float
     assert result.degrees_fahrenheit == value.get('degrees_fahrenheit')